@@ -1,42 +1,115 @@
-import requests
-import json
-from typing import Dict, Optional, Union
-from datetime import datetime, timedelta
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import ijson
+import orjson
+import threading
+from typing import Dict, List, NamedTuple, Optional, Union
+from datetime import datetime
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+# Room modes accepted by set_room_mode
+_VALID_MODES = frozenset(("program", "away", "hg", "manual"))
+_VALID_MODES_STR = "program, away, hg, manual"
+
+# Water heater modes accepted by set_water_heater_mode
+_CONTACTOR_MODES = frozenset(("auto", "manual"))
+
+# Energy measurement types requested for each room by get_home_measure
+_MEASURE_TYPES = (
+    "sum_energy_elec_hot_water",
+    "sum_energy_elec_heating",
+    "sum_energy_elec",
+    "sum_energy_elec$0",
+    "sum_energy_elec$1",
+    "sum_energy_elec$2",
+)
+
+# Seconds of history requested by get_home_measure
+_MEASURE_WINDOW = 24 * 60 * 60
+
+# Templates for IntuisRoom/IntuisWaterHeater __str__
+_ROOM_FMT = (
+    "Room: {name} ({type})\n"
+    "- ID: {id}\n"
+    "- Current Temperature: {current}°C\n"
+    "- Target Temperature: {target}°C\n"
+    "- Mode: {mode}\n"
+    "- Heating Power: {power}\n"
+    "- Energy Consumption: {energy} kWh\n"
+)
+_WATER_HEATER_FMT = (
+    "Water Heater: {id} in room {room_id}\n"
+    "- Boiler Status: {boiler}\n"
+    "- Connection Status: {connection}\n"
+    "- Contactor Mode: {contactor}\n"
+    "- Firmware Revision: {firmware}\n"
+    "- Last Seen: {last_seen}\n"
+    "- Bridge: {bridge}\n"
+)
+
+
+class IntuisNetatmoAPIError(Exception):
+    """Raised when a request to the Intuis API fails"""
+
+
+class IntuisNetatmoAuthError(IntuisNetatmoAPIError):
+    """Raised when the Intuis API rejects the account credentials"""
+
+
+@functools.lru_cache(maxsize=1)
+def _load_secrets(path: str = "secrets.json") -> Dict:
+    """
+    Load credentials from a JSON secrets file, read from disk only once.
+
+    Args:
+        path (str): Path of the secrets file
+
+    Returns:
+        Dict: Parsed secrets
+    """
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
 
 
 class IntuisNetatmo:
     def __init__(
         self,
-        username: str,
-        password: str,
-        client_id: str,
-        client_secret: str,
+        *,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
         base_url: str = "https://app.muller-intuitiv.net",
     ):
-        self.do_init(username, password, client_id, client_secret, base_url)
-
-    def __init__(self, base_url: str = "https://app.muller-intuitiv.net"):
         """
         Initialize the IntuisNetatmo client.
 
+        Any credential not passed in is read from secrets.json.
+
         Args:
-            username (str): Your Intuis account username
-            password (str): Your Intuis account password
-            client_id (str): Your Intuis client ID
-            client_secret (str): Your Intuis client secret
+            username (str, optional): Your Intuis account username
+            password (str, optional): Your Intuis account password
+            client_id (str, optional): Your Intuis client ID
+            client_secret (str, optional): Your Intuis client secret
             base_url (str): Base URL for the Intuis API
         """
-        try:
-            with open("secrets.json") as f:
-                secrets = json.load(f)
-            username = secrets.get("username")
-            password = secrets.get("password")
-            client_id = secrets.get("client_id")
-            client_secret = secrets.get("client_secret")
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            raise ValueError(
-                "Missing credentials and could not load from secrets.json"
-            ) from e
+        if None in (username, password, client_id, client_secret):
+            try:
+                secrets = _load_secrets()
+            except (FileNotFoundError, orjson.JSONDecodeError) as e:
+                raise ValueError(
+                    "Missing credentials and could not load from secrets.json"
+                ) from e
+            username = username or secrets.get("username")
+            password = password or secrets.get("password")
+            client_id = client_id or secrets.get("client_id")
+            client_secret = client_secret or secrets.get("client_secret")
 
         if not all([username, password, client_id, client_secret]):
             raise ValueError(
@@ -51,56 +124,211 @@ class IntuisNetatmo:
         self.password = password
         self.client_id = client_id
         self.client_secret = client_secret
-        self.session = requests.Session()
+        # HTTP/2 lets concurrent requests share a single connection
+        self.client = httpx.Client(
+            base_url=base_url,
+            timeout=30.0,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+            ),
+        )
+        self._token_lock = threading.Lock()
         self.token = None
         self.refresh_token = None
         self.token_expiry = None
         self.homesdata = None
+        self._home = None  # First home in homesdata
         self.home_id = None
         self.home_name = None
+        self._rooms_by_lower_name = {}  # Room IDs from homesdata, keyed by lower-cased name
         self.homestatus = None
+        self._home_status = None  # Home in homestatus
+        self._rooms_by_id = {}  # Room status dicts from homestatus, keyed by room ID
+        self._modules_by_id = {}  # Module status dicts from homestatus, keyed by module ID
         self.router_id = None
         self.rooms = {}  # Dictionary to store IntuisRoom objects, keyed by room ID
         self.water_heaters = {}  # Dictionary to store WaterHeater objects, keyed by module ID
         self.measures = None
 
-    def _get_token(self) -> str:
+    @staticmethod
+    def _parse(response: httpx.Response) -> Dict:
+        """
+        Decode a JSON API response.
+
+        Args:
+            response (httpx.Response): Response to decode
+
+        Returns:
+            Dict: Decoded response body
+
+        Raises:
+            IntuisNetatmoAPIError: If the body is not valid JSON
+        """
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as err:
+            raise IntuisNetatmoAPIError(f"Invalid JSON response: {err}") from err
+
+    def _get_token(self, rejected_token: Optional[str] = None) -> str:
         """
         Get or refresh the authentication token.
 
+        Safe to call from several threads; only one of them renews the token.
+
+        Args:
+            rejected_token (str, optional): Token the API just rejected. It is
+                renewed even if not yet expired, unless another thread has
+                already replaced it.
+
         Returns:
             str: Authentication token
+
+        Raises:
+            IntuisNetatmoAuthError: If the credentials are rejected
+            IntuisNetatmoAPIError: If authentication fails for any other reason
         """
-        if (
-            self.token
-            and self.token_expiry
-            and datetime.now().timestamp() < self.token_expiry
-        ):
-            return self.token
+        with self._token_lock:
+            if rejected_token is not None:
+                if self.token != rejected_token:
+                    return self.token
+            elif (
+                self.token
+                and self.token_expiry
+                and datetime.now().timestamp() < self.token_expiry
+            ):
+                return self.token
 
+            return self._fetch_token()
+
+    def _fetch_token(self) -> str:
+        """
+        Fetch a new authentication token.
+
+        Uses the refresh token when one is available, falling back to a
+        password login if there is none or it has been rejected.
+
+        Returns:
+            str: Authentication token
+
+        Raises:
+            IntuisNetatmoAuthError: If the credentials are rejected
+            IntuisNetatmoAPIError: If authentication fails for any other reason
+        """
         url = f"{self.base_url}/oauth2/token"
         data = {
             "client_id": self.client_id,
             "client_secret": self.client_secret,
-            "grant_type": "password",
-            "user_prefix": "muller",
-            "scope": "read_muller write_muller",
-            "username": self.username,
-            "password": self.password,
         }
-        headers = {"Content-Type": "application/x-www-form-urlencoded"}
-
-        response = self.session.post(url, data=data, headers=headers)
-        response.raise_for_status()
 
-        result = response.json()
+        try:
+            response = None
+            if self.refresh_token:
+                response = self._post_token_request(
+                    url,
+                    {
+                        **data,
+                        "grant_type": "refresh_token",
+                        "refresh_token": self.refresh_token,
+                    },
+                )
+            if response is None or not response.is_success:
+                response = self._post_token_request(
+                    url,
+                    {
+                        **data,
+                        "grant_type": "password",
+                        "user_prefix": "muller",
+                        "scope": "read_muller write_muller",
+                        "username": self.username,
+                        "password": self.password,
+                    },
+                )
+            response.raise_for_status()
+        except httpx.HTTPStatusError as err:
+            # The password grant itself was refused, so retrying won't help
+            if err.response.status_code in (400, 401, 403):
+                raise IntuisNetatmoAuthError(f"Invalid credentials: {err}") from err
+            raise IntuisNetatmoAPIError(f"Authentication failed: {err}") from err
+        except httpx.HTTPError as err:
+            raise IntuisNetatmoAPIError(f"Authentication failed: {err}") from err
+
+        result = self._parse(response)
         self.token = result.get("access_token")
-        self.refresh_token = result.get("refresh_token")
-        # Assuming token expires in 1 hour
-        self.token_expiry = datetime.now().timestamp() + 3600
+        self.refresh_token = result.get("refresh_token", self.refresh_token)
+        # Renew up to 5 minutes early so requests never go out with a token about
+        # to expire; short-lived tokens keep at least half their lifetime
+        expires_in = int(result.get("expires_in", 3600))
+        self.token_expiry = (
+            datetime.now().timestamp() + expires_in - min(300, expires_in // 2)
+        )
+        # Every subsequent request on the client picks this up automatically
+        self.client.headers["Authorization"] = f"Bearer {self.token}"
 
         return self.token
 
+    def _post_token_request(self, url: str, data: Dict) -> httpx.Response:
+        """
+        POST a grant to the token endpoint without the client's bearer token.
+
+        Args:
+            url (str): Token endpoint URL
+            data (Dict): Form fields of the grant
+
+        Returns:
+            httpx.Response: Response from the token endpoint
+        """
+        request = self.client.build_request(
+            "POST", url, data=data, headers=_FORM_HEADERS
+        )
+        # Don't send the current, possibly stale, credentials along with the grant
+        request.headers.pop("Authorization", None)
+        return self.client.send(request)
+
+    def _request(
+        self, method: str, url: str, stream: bool = False, **kwargs
+    ) -> httpx.Response:
+        """
+        Send an authenticated request, renewing the token and retrying once on a 401.
+
+        Args:
+            method (str): HTTP method
+            url (str): URL to request
+            stream (bool): Leave the body unread; the caller must close the response
+            **kwargs: Passed through to httpx.Client.build_request
+
+        Returns:
+            httpx.Response: Successful response
+
+        Raises:
+            IntuisNetatmoAPIError: If the request fails or the API returns an error status
+        """
+        token = self._get_token()
+        try:
+            response = self.client.send(
+                self.client.build_request(method, url, **kwargs), stream=stream
+            )
+            if response.status_code == 401:
+                response.close()
+                self._get_token(rejected_token=token)
+                # Rebuild so the request carries the new Authorization header
+                response = self.client.send(
+                    self.client.build_request(method, url, **kwargs), stream=stream
+                )
+            if response.is_error:
+                response.close()
+            response.raise_for_status()
+        except httpx.HTTPError as err:
+            raise IntuisNetatmoAPIError(f"Request to {url} failed: {err}") from err
+        return response
+
+    def close(self) -> None:
+        """
+        Close the HTTP client and its connection pool.
+        """
+        self.client.close()
+
     def pull_data(self):
         """
         Pull all initial data from the Intuis API, and setup internal structures
@@ -115,67 +343,77 @@ class IntuisNetatmo:
         Returns:
             Dict: Homes data and their information
         """
-        token = self._get_token()
         url = f"{self.base_url}/api/homesdata"
-        headers = {"Authorization": f"Bearer {token}"}
 
-        response = self.session.get(url, headers=headers)
-        response.raise_for_status()
+        response = self._request("GET", url)
 
         # Parse out the required info...
-        self.homesdata = response.json()
-        self.home_id = self.homesdata["body"]["homes"][0]["id"]
-        self.home_name = self.homesdata["body"]["homes"][0]["name"]
+        payload = self._parse(response)
+        self.homesdata = payload
+        self._home = self.homesdata["body"]["homes"][0]
+        self.home_id = self._home["id"]
+        self.home_name = self._home["name"]
+        modules_by_id = {module["id"]: module for module in self._home["modules"]}
         # Find the first NMG module (router) and store its ID
-        for module in self.homesdata["body"]["homes"][0]["modules"]:
-            if module.get("type") == "NMG":
-                self.router_id = module.get("id")
-                break
+        self.router_id = next(
+            (
+                module["id"]
+                for module in self._home["modules"]
+                if module.get("type") == "NMG"
+            ),
+            None,
+        )
         # Create IntuisRoom instances for each room
         self.rooms = {}
-        for room in self.homesdata["body"]["homes"][0]["rooms"]:
-            if "module_ids" in room and room["module_ids"]:
-                room_id = room["id"]
-                room_name = room["name"]
-                room_type = room["type"]
-                intuis_room = None
-                intuis_water_heater = None
-                for module_id in room["module_ids"]:
-                    # Find the module in the homesdata and add it to the room
-                    for module in self.homesdata["body"]["homes"][0]["modules"]:
-                        if module["id"] == module_id:
-                            if module["type"] == "NMH":
-                                if intuis_room == None:
-                                    intuis_room = IntuisRoom(
-                                        room_id=room_id,
-                                        room_name=room_name,
-                                        room_type=room_type,
-                                    )
-                                intuis_room.add_module(
-                                    module
-                                )  # Pass the entire module dictionary
-                            elif module["type"] == "NMW":
-                                if intuis_water_heater == None:
-                                    intuis_water_heater = IntuisWaterHeater(
-                                        room_id=room_id,
-                                        heater_id=module_id,
-                                        heater_name=room_name,
-                                    )
-                            else:
-                                print(
-                                    f"Warning: Unknown module type {module['type']} for room {room_name}"
-                                )
-
-                            break
-                # Add modules to the room if any are defined
-                if intuis_room:
-                    self.rooms[room_id] = intuis_room
-                    print(f"Added room: {str(intuis_room)}")
-                if intuis_water_heater:
-                    self.water_heaters[room_id] = intuis_water_heater
-                    print(f"Added water heater: {str(intuis_water_heater)}")
-
-        return response.json()
+        for room in self._home["rooms"]:
+            module_ids = room.get("module_ids")
+            if not module_ids:
+                continue
+            room_id = room["id"]
+            room_name = room["name"]
+            intuis_room = None
+            intuis_water_heater = None
+            for module_id in module_ids:
+                # Find the module in the homesdata and add it to the room
+                module = modules_by_id.get(module_id)
+                if module is None:
+                    continue
+                module_type = module["type"]
+                if module_type == "NMH":
+                    if intuis_room is None:
+                        intuis_room = IntuisRoom(
+                            room_id=room_id,
+                            room_name=room_name,
+                            room_type=room["type"],
+                        )
+                    intuis_room.add_module(module)  # Pass the entire module dictionary
+                elif module_type == "NMW":
+                    if intuis_water_heater is None:
+                        intuis_water_heater = IntuisWaterHeater(
+                            room_id=room_id,
+                            heater_id=module_id,
+                            heater_name=room_name,
+                        )
+                else:
+                    _LOGGER.warning(
+                        "Unknown module type %s for room %s", module_type, room_name
+                    )
+            # Add modules to the room if any are defined
+            if intuis_room:
+                self.rooms[room_id] = intuis_room
+                _LOGGER.debug("Added room: %s", intuis_room)
+            if intuis_water_heater:
+                self.water_heaters[room_id] = intuis_water_heater
+                _LOGGER.debug("Added water heater: %s", intuis_water_heater)
+
+        # Index room names for get_room_id_by_name, first room wins on duplicates
+        self._rooms_by_lower_name = {}
+        for room in self._home["rooms"]:
+            self._rooms_by_lower_name.setdefault(
+                room.get("name", "").lower(), room.get("id")
+            )
+
+        return payload
 
     def get_homestatus(self) -> Dict:
         """
@@ -184,59 +422,64 @@ class IntuisNetatmo:
         Returns:
             Dict: Home status information including rooms and modules
         """
-        token = self._get_token()
         url2 = f"{self.base_url}/syncapi/v1/homestatus"
         url1 = f"{self.base_url}/syncapi/v1/getconfigs"
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
         data = {"home_id": self.home_id}
 
-        response = self.session.post(url1, headers=headers, data=data)
-        response.raise_for_status()
-        response = self.session.post(url2, headers=headers, data=data)
-        response.raise_for_status()
-        self.homestatus = response.json()
+        # getconfigs and homestatus are independent, so send them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            configs_future = executor.submit(
+                self._request, "POST", url1, headers=_FORM_HEADERS, data=data
+            )
+            status_future = executor.submit(
+                self._request, "POST", url2, headers=_FORM_HEADERS, data=data
+            )
+            configs_future.result()
+            response = status_future.result()
+        payload = self._parse(response)
+        self.homestatus = payload
+        self._home_status = self.homestatus["body"]["home"]
+        self._rooms_by_id = {r["id"]: r for r in self._home_status["rooms"]}
+        self._modules_by_id = {m["id"]: m for m in self._home_status["modules"]}
 
         # Update room statuses
         for room in self.rooms.values():
             # Find matching room status by room ID
-            matching_room = next(
-                (
-                    r
-                    for r in self.homestatus["body"]["home"]["rooms"]
-                    if r["id"] == room.id
-                ),
-                None,
-            )
+            matching_room = self._rooms_by_id.get(room.id)
             if matching_room:
                 room.update_status(matching_room)
             else:
-                print(f"Warning: No status found for room {room.id}")
+                _LOGGER.warning("No status found for room %s", room.id)
 
         # Update water heater statuses
         for water_heater in self.water_heaters.values():
-            matching_water_heater = next(
-                (
-                    r
-                    for r in self.homestatus["body"]["home"]["modules"]
-                    if r["id"] == water_heater.id
-                ),
-                None,
-            )
+            matching_water_heater = self._modules_by_id.get(water_heater.id)
             if matching_water_heater:
                 water_heater.update_status(matching_water_heater)
             else:
-                print(f"Warning: No status found for water heater {water_heater.id}")
+                _LOGGER.warning(
+                    "No status found for water heater %s", water_heater.id
+                )
+
+        return payload
+
+    async def async_get_homestatus(self, hass) -> Dict:
+        """
+        Refresh the home status without blocking the Home Assistant event loop.
+
+        Args:
+            hass (HomeAssistant): Home Assistant instance whose executor runs the requests
 
-        return response.json()
+        Returns:
+            Dict: Home status information including rooms and modules
+        """
+        return await hass.async_add_executor_job(self.get_homestatus)
 
     def print_home_info(self) -> None:
         """
         Print information about the home including home name, ID and all rooms.
         """
-        print(f"\nHome Name: {self.homesdata['body']['homes'][0]['name']}")
+        print(f"\nHome Name: {self._home['name']}")
         print(f"Home ID: {self.home_id}")
         print("\nRooms:")
         for room in self.rooms.values():
@@ -254,8 +497,8 @@ class IntuisNetatmo:
             filename (str): Name of file to write to
         """
         try:
-            with open(filename, "w") as f:
-                json.dump(data, f, indent=2)
+            with open(filename, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         except Exception as e:
             print(f"Error writing debug file {filename}: {str(e)}")
 
@@ -270,54 +513,96 @@ class IntuisNetatmo:
         if hasattr(self, "measures"):
             self.write_json_to_file(self.measures, "measures_debug.json")
 
-    def get_home_measure(self, scale: str = "30min"):
+    def get_home_measure(self, scale: str = "30min", debug: bool = False) -> Dict:
         """
         Get measurements for the home.
 
+        The response is streamed and parsed one room at a time, so the full
+        payload is never held in memory at once.
+
         Args:
             scale (str): Time scale for measurements (e.g., "1hour", "1day", "1week")
+            debug (bool): Keep the measurements in self.measures for write_debug_files
 
         Returns:
-            Dict: Home measurements data
+            Dict: Room measurements keyed by room ID
         """
-        token = self._get_token()
-        print(token)
         url = f"{self.base_url}/api/gethomemeasure"
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        }
+        # Add rooms data with bridge and measurement types
+        rooms = [
+            {"id": room.id, "bridge": self.router_id, "type": _MEASURE_TYPES}
+            for room in self.rooms.values()
+        ]
+        rooms.extend(
+            {
+                "id": water_heater.room_id,
+                "bridge": self.router_id,
+                "type": _MEASURE_TYPES,
+            }
+            for water_heater in self.water_heaters.values()
+        )
+        now = int(datetime.now().timestamp())
         data = {
-            "date_end": int(datetime.now().timestamp()),
-            "date_begin": int((datetime.now() - timedelta(hours=24)).timestamp()),
+            "date_end": now,
+            "date_begin": now - _MEASURE_WINDOW,
             "app_identifier": "app_muller",
             "scale": scale,
             "real_time": True,
-            "home": {"id": self.home_id, "rooms": []},
+            "home": {"id": self.home_id, "rooms": rooms},
         }
-        # Add rooms data with bridge and measurement types
-        types = [
-            "sum_energy_elec_hot_water",
-            "sum_energy_elec_heating",
-            "sum_energy_elec",
-            "sum_energy_elec$0",
-            "sum_energy_elec$1",
-            "sum_energy_elec$2",
-        ]
-        for room in self.rooms.values():
-            data["home"]["rooms"].append(
-                {"id": room.id, "bridge": self.router_id, "type": types}
-            )
-        for water_heater in self.water_heaters.values():
-            data["home"]["rooms"].append(
-                {"id": water_heater.room_id, "bridge": self.router_id, "type": types}
-            )
-        print(data)
-        response = self.session.post(url, headers=headers, data=json.dumps(data))
-        response.raise_for_status()
-        print(response.json())
-        self.measures = response.json()
-        return response.json()
+        _LOGGER.debug("Requesting home measures: %s", data)
+        response = self._request(
+            "POST", url, headers=_JSON_HEADERS, content=orjson.dumps(data), stream=True
+        )
+        measures = {}
+        parsed_rooms = ijson.sendable_list()
+        parser = ijson.items_coro(parsed_rooms, "body.home.rooms.item", use_float=True)
+        try:
+            for chunk in response.iter_bytes():
+                parser.send(chunk)
+                for room in parsed_rooms:
+                    measures[room["id"]] = room
+                del parsed_rooms[:]
+            # Closing raises on truncated JSON and may yield a final room
+            parser.close()
+            for room in parsed_rooms:
+                measures[room["id"]] = room
+        except (httpx.HTTPError, ijson.JSONError) as err:
+            raise IntuisNetatmoAPIError(f"Error reading home measures: {err}") from err
+        finally:
+            response.close()
+        if debug:
+            self.measures = measures
+        return measures
+
+    def set_rooms_state(self, updates: List[Dict]) -> Dict:
+        """
+        Set the mode, and optionally the setpoint, of several rooms in one request.
+
+        Args:
+            updates (List[Dict]): One entry per room with keys "room_id" and "mode",
+                plus optional "temp" (Celsius) and "end_time" (Unix timestamp)
+
+        Returns:
+            Dict: Response from the API
+        """
+        url = f"{self.base_url}/syncapi/v1/setstate"
+
+        rooms = []
+        for update in updates:
+            room = {"id": update["room_id"], "therm_setpoint_mode": update["mode"]}
+            if update.get("temp") is not None:
+                room["therm_setpoint_temperature"] = update["temp"]
+            if update.get("end_time"):
+                room["therm_setpoint_end_time"] = update["end_time"]
+            rooms.append(room)
+
+        data = {"home": {"id": self.home_id, "rooms": rooms}}
+
+        response = self._request(
+            "POST", url, headers=_JSON_HEADERS, content=orjson.dumps(data)
+        )
+        return self._parse(response)
 
     def set_room_setpoint(
         self, room_id: str, temp: float, end_time: Optional[int] = None
@@ -333,32 +618,9 @@ class IntuisNetatmo:
         Returns:
             Dict: Response from the API
         """
-        token = self._get_token()
-        url = f"{self.base_url}/syncapi/v1/setstate"
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        }
-
-        data = {
-            "home": {
-                "id": self.home_id,
-                "rooms": [
-                    {
-                        "id": room_id,
-                        "therm_setpoint_mode": "manual",
-                        "therm_setpoint_temperature": temp,
-                    }
-                ],
-            }
-        }
-
-        if end_time:
-            data["home"]["rooms"][0]["therm_setpoint_end_time"] = end_time
-
-        response = self.session.post(url, headers=headers, data=json.dumps(data))
-        response.raise_for_status()
-        return response.json()
+        return self.set_rooms_state(
+            [{"room_id": room_id, "mode": "manual", "temp": temp, "end_time": end_time}]
+        )
 
     def set_room_off(self, room_id: str) -> Dict:
         """
@@ -370,29 +632,7 @@ class IntuisNetatmo:
         Returns:
             Dict: Response from the API
         """
-        token = self._get_token()
-        url = f"{self.base_url}/syncapi/v1/setstate"
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        }
-
-        data = {
-            "home": {
-                "id": self.home_id,
-                "rooms": [
-                    {
-                        "id": room_id,
-                        "therm_setpoint_mode": "off",
-                        "therm_setpoint_temperature": 7,
-                    }
-                ],
-            }
-        }
-
-        response = self.session.post(url, headers=headers, data=json.dumps(data))
-        response.raise_for_status()
-        return response.json()
+        return self.set_rooms_state([{"room_id": room_id, "mode": "off", "temp": 7}])
 
     def set_room_hg(self, room_id: str) -> Dict:
         """
@@ -404,12 +644,7 @@ class IntuisNetatmo:
         Returns:
             Dict: Response from the API
         """
-        token = self._get_token()
         url = f"{self.base_url}/api/setroomthermpoint"
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        }
 
         data = {
             "home": {
@@ -424,9 +659,10 @@ class IntuisNetatmo:
             }
         }
 
-        response = self.session.post(url, headers=headers, data=json.dumps(data))
-        response.raise_for_status()
-        return response.json()
+        response = self._request(
+            "POST", url, headers=_JSON_HEADERS, content=orjson.dumps(data)
+        )
+        return self._parse(response)
 
     def get_room_id_by_name(self, room_name: str) -> str:
         """
@@ -444,12 +680,7 @@ class IntuisNetatmo:
         if not self.homesdata:
             raise ValueError("Must call pull_data() or get_homesdata() first")
 
-        for room in (
-            self.homesdata.get("body", {}).get("homes", [{}])[0].get("rooms", [])
-        ):
-            if room.get("name", "").lower() == room_name.lower():
-                return room.get("id")
-        return None
+        return self._rooms_by_lower_name.get(room_name.lower())
 
     def set_room_mode(self, room_id: str, mode: str, temperature: float = None) -> Dict:
         """
@@ -466,33 +697,17 @@ class IntuisNetatmo:
         Raises:
             ValueError: If using manual mode without temperature or invalid mode
         """
-        valid_modes = ["program", "away", "hg", "manual"]
-        if mode not in valid_modes:
-            raise ValueError(f"Mode must be one of: {', '.join(valid_modes)}")
+        if mode not in _VALID_MODES:
+            raise ValueError(f"Mode must be one of: {_VALID_MODES_STR}")
 
         if mode == "manual" and temperature is None:
             raise ValueError("Temperature must be specified when using manual mode")
 
-        token = self._get_token()
-        url = f"{self.base_url}/api/setroomthermpoint"
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        }
-
-        data = {
-            "home": {
-                "id": self.home_id,
-                "rooms": [{"id": room_id, "therm_setpoint_mode": mode}],
-            }
-        }
-
+        update = {"room_id": room_id, "mode": mode}
         if mode == "manual":
-            data["home"]["rooms"][0]["therm_setpoint_temperature"] = temperature
+            update["temp"] = temperature
 
-        response = self.session.post(url, headers=headers, data=json.dumps(data))
-        response.raise_for_status()
-        return response.json()
+        return self.set_rooms_state([update])
 
     def get_room_mode(self, room_id: str) -> Dict:
         """
@@ -510,16 +725,16 @@ class IntuisNetatmo:
         if not self.homestatus:
             self.get_homestatus()
 
-        for room in self.homestatus["body"]["home"]["rooms"]:
-            if room["id"] == room_id:
-                return {
-                    "mode": room["therm_setpoint_mode"],
-                    "current_temp": room["therm_measured_temperature"],
-                    "target_temp": room["therm_setpoint_temperature"],
-                    "end_time": room["therm_setpoint_end_time"],
-                }
+        room = self._rooms_by_id.get(room_id)
+        if room is None:
+            raise ValueError(f"Room ID {room_id} not found")
 
-        raise ValueError(f"Room ID {room_id} not found")
+        return {
+            "mode": room["therm_setpoint_mode"],
+            "current_temp": room["therm_measured_temperature"],
+            "target_temp": room["therm_setpoint_temperature"],
+            "end_time": room["therm_setpoint_end_time"],
+        }
 
     def get_room_setpoint(self, room_id: str) -> Dict:
         """
@@ -537,14 +752,14 @@ class IntuisNetatmo:
         if not self.homestatus:
             self.get_homestatus()
 
-        for room in self.homestatus["body"]["home"]["rooms"]:
-            if room["id"] == room_id:
-                return {
-                    "target_temp": room["therm_setpoint_temperature"],
-                    "end_time": room["therm_setpoint_end_time"],
-                }
+        room = self._rooms_by_id.get(room_id)
+        if room is None:
+            raise ValueError(f"Room ID {room_id} not found")
 
-        raise ValueError(f"Room ID {room_id} not found")
+        return {
+            "target_temp": room["therm_setpoint_temperature"],
+            "end_time": room["therm_setpoint_end_time"],
+        }
 
     def get_room_temperature(self, room_id: str) -> float:
         """
@@ -562,11 +777,11 @@ class IntuisNetatmo:
         if not self.homestatus:
             self.get_homestatus()
 
-        for room in self.homestatus["body"]["home"]["rooms"]:
-            if room["id"] == room_id:
-                return room["therm_measured_temperature"]
+        room = self._rooms_by_id.get(room_id)
+        if room is None:
+            raise ValueError(f"Room ID {room_id} not found")
 
-        raise ValueError(f"Room ID {room_id} not found")
+        return room["therm_measured_temperature"]
 
     def get_water_heater_mode(self, water_heater_id: str) -> str:
         """
@@ -584,11 +799,11 @@ class IntuisNetatmo:
         if not self.homestatus:
             self.get_homestatus()
 
-        for module in self.homestatus["body"]["home"]["modules"]:
-            if module["id"] == water_heater_id and module["type"] == "NMW":
-                return module["contactor_mode"]
+        module = self._modules_by_id.get(water_heater_id)
+        if module is None or module["type"] != "NMW":
+            raise ValueError(f"Water heater ID {water_heater_id} not found")
 
-        raise ValueError(f"Water heater ID {water_heater_id} not found")
+        return module["contactor_mode"]
 
     def set_water_heater_mode(self, water_heater_id: str, mode: str) -> Dict:
         """
@@ -604,15 +819,10 @@ class IntuisNetatmo:
         Raises:
             ValueError: If mode is not 'auto' or 'manual'
         """
-        if mode not in ["auto", "manual"]:
+        if mode not in _CONTACTOR_MODES:
             raise ValueError("Mode must be 'auto' or 'manual'")
 
-        token = self._get_token()
         url = f"{self.base_url}/api/setcontactormode"
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-        }
 
         data = {
             "home": {
@@ -621,14 +831,35 @@ class IntuisNetatmo:
             }
         }
 
-        response = self.session.post(url, headers=headers, data=json.dumps(data))
-        response.raise_for_status()
-        return response.json()
+        response = self._request(
+            "POST", url, headers=_JSON_HEADERS, content=orjson.dumps(data)
+        )
+        return self._parse(response)
+
+
+class IntuisModule(NamedTuple):
+    """Module associated with an Intuis room"""
+
+    id: str
+    name: str
+    type: str
 
 
 class IntuisRoom:
     """Class representing an Intuis room thermostat"""
 
+    __slots__ = (
+        "id",
+        "name",
+        "type",
+        "current_temp",
+        "target_temp",
+        "mode",
+        "heating_power",
+        "energy_consumption",
+        "associated_modules",
+    )
+
     def __init__(self, room_id: str, room_name: str, room_type: str):
         """Initialize room thermostat
 
@@ -667,32 +898,48 @@ class IntuisRoom:
             module (dict): Module data from API
         """
         self.associated_modules.append(
-            {
-                "id": module.get("id"),
-                "name": module.get("name"),
-                "type": module.get("type"),
-            }
+            IntuisModule(
+                id=module.get("id"),
+                name=module.get("name"),
+                type=module.get("type"),
+            )
         )
 
     def __str__(self) -> str:
         """String representation of room status"""
-        status = f"Room: {self.name} ({self.type})\n"
-        status += f"- ID: {self.id}\n"
-        status += f"- Current Temperature: {self.current_temp}°C\n"
-        status += f"- Target Temperature: {self.target_temp}°C\n"
-        status += f"- Mode: {self.mode}\n"
-        status += f"- Heating Power: {self.heating_power}\n"
-        status += f"- Energy Consumption: {self.energy_consumption} kWh\n"
+        status = _ROOM_FMT.format(
+            name=self.name,
+            type=self.type,
+            id=self.id,
+            current=self.current_temp,
+            target=self.target_temp,
+            mode=self.mode,
+            power=self.heating_power,
+            energy=self.energy_consumption,
+        )
         if self.associated_modules:
-            status += "- Associated Modules:\n"
-            for module in self.associated_modules:
-                status += f"    - {module['name']} ({module['type']})\n"
+            status += "- Associated Modules:\n" + "".join(
+                f"    - {module.name} ({module.type})\n"
+                for module in self.associated_modules
+            )
         return status
 
 
 class IntuisWaterHeater:
     """Class representing a Netatmo Intuis water heater device"""
 
+    __slots__ = (
+        "id",
+        "room_id",
+        "name",
+        "boiler_status",
+        "connection_status",
+        "contactor_mode",
+        "firmware_revision",
+        "last_seen",
+        "bridge",
+    )
+
     def __init__(self, heater_id: str, heater_name: str, room_id: str) -> None:
         """Initialize water heater
 
@@ -724,11 +971,13 @@ class IntuisWaterHeater:
 
     def __str__(self) -> str:
         """String representation of water heater status"""
-        status = f"Water Heater: {self.id} in room {self.room_id}\n"
-        status += f"- Boiler Status: {'On' if self.boiler_status else 'Off'}\n"
-        status += f"- Connection Status: {self.connection_status}\n"
-        status += f"- Contactor Mode: {self.contactor_mode}\n"
-        status += f"- Firmware Revision: {self.firmware_revision}\n"
-        status += f"- Last Seen: {self.last_seen}\n"
-        status += f"- Bridge: {self.bridge}\n"
-        return status
+        return _WATER_HEATER_FMT.format(
+            id=self.id,
+            room_id=self.room_id,
+            boiler="On" if self.boiler_status else "Off",
+            connection=self.connection_status,
+            contactor=self.contactor_mode,
+            firmware=self.firmware_revision,
+            last_seen=self.last_seen,
+            bridge=self.bridge,
+        )
@@ -1,6 +1,25 @@
 """The Muller Intuitiv Climate Integration integration."""
 
-DOMAIN = "mullerintuitiv"
+from __future__ import annotations
+
+from functools import partial
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import (
+    CONF_CLIENT_ID,
+    CONF_CLIENT_SECRET,
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    Platform,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+
+from .const import DOMAIN
+from .coordinator import IntuisNetatmoCoordinator
+from .IntuisNetatmo import IntuisNetatmo, IntuisNetatmoAPIError, IntuisNetatmoAuthError
+
+PLATFORMS = [Platform.CLIMATE]
 
 
 async def async_setup(hass, config):
@@ -8,3 +27,49 @@ async def async_setup(hass, config):
 
     # Return boolean to indicate that initialization was successful.
     return True
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Set up Muller Intuitiv Climate Integration from a config entry."""
+    # Create IntuisNetatmo client; its constructor does blocking I/O
+    client = await hass.async_add_executor_job(
+        partial(
+            IntuisNetatmo,
+            username=entry.data[CONF_USERNAME],
+            password=entry.data[CONF_PASSWORD],
+            client_id=entry.data[CONF_CLIENT_ID],
+            client_secret=entry.data[CONF_CLIENT_SECRET],
+        )
+    )
+
+    try:
+        # Pull the home layout; the coordinator fetches the room statuses
+        try:
+            await hass.async_add_executor_job(client.get_homesdata)
+        except IntuisNetatmoAuthError as err:
+            raise ConfigEntryAuthFailed(f"Invalid credentials: {err}") from err
+        except IntuisNetatmoAPIError as err:
+            raise ConfigEntryNotReady(f"Error fetching home data: {err}") from err
+
+        coordinator = IntuisNetatmoCoordinator(hass, entry, client)
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # A retried setup builds a new client, so release this one's connections
+        await hass.async_add_executor_job(client.close)
+        raise
+
+    # Shared by every platform so they reuse one client and one poll
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    return True
+
+
+async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Unload a config entry."""
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        coordinator: IntuisNetatmoCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator.async_cancel_writes()
+        await hass.async_add_executor_job(coordinator.client.close)
+    return unload_ok
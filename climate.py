@@ -2,20 +2,17 @@
 
 from __future__ import annotations
 
-XXX
-
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 
-import voluptuous as vol
-
 from homeassistant.components.climate import (
     ClimateEntity,
     ClimateEntityFeature,
     HVACAction,
     HVACMode,
 )
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import SOURCE_IMPORT, ConfigEntry
 from homeassistant.const import (
     ATTR_TEMPERATURE,
     CONF_CLIENT_ID,
@@ -23,51 +20,31 @@ from homeassistant.const import (
     CONF_PASSWORD,
     CONF_USERNAME,
     PRECISION_TENTHS,
-    TEMP_CELSIUS,
     UnitOfTemperature,
 )
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers import entity_platform
-import homeassistant.helpers.config_validation as cv
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
-from IntuisNetatmo import IntuisNetatmo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .const import DOMAIN
+from .coordinator import IntuisNetatmoCoordinator
+from .IntuisNetatmo import IntuisNetatmoAPIError
 
-_LOGGER = logging.getLogger(__name__)
 
-# Configuration schema
-CONFIG_SCHEMA = vol.Schema(
-    {
-        vol.Required(CONF_USERNAME): cv.string,
-        vol.Required(CONF_PASSWORD): cv.string,
-        vol.Required(CONF_CLIENT_ID): cv.string,
-        vol.Required(CONF_CLIENT_SECRET): cv.string,
-    }
-)
+_LOGGER = logging.getLogger(__name__)
 
-# Service schema for setting temperature
-SERVICE_SET_TEMPERATURE = "set_temperature"
-SERVICE_SET_TEMPERATURE_SCHEMA = vol.Schema(
-    {
-        vol.Required(ATTR_TEMPERATURE): vol.Coerce(float),
-    }
-)
+# Data comes from the coordinator, so entity updates need no serialising
+PARALLEL_UPDATES = 0
 
-# Map IntuisNetatmo modes to Home Assistant modes
-MODE_MAP = {
-    "program": HVACMode.AUTO,
-    "manual": HVACMode.HEAT,
-    "off": HVACMode.OFF,
-    "hg": HVACMode.OFF,  # Frost protection
-}
+# Seconds to wait for further setpoint changes before sending the latest one
+SETPOINT_DEBOUNCE = 0.25
 
-# Map IntuisNetatmo modes to Home Assistant actions
-ACTION_MAP = {
-    "program": HVACAction.IDLE,
-    "manual": HVACAction.HEATING,
-    "off": HVACAction.IDLE,
-    "hg": HVACAction.IDLE,
+# Map Home Assistant modes to IntuisNetatmo modes
+HVAC_TO_MODE = {
+    HVACMode.AUTO: "program",
+    HVACMode.HEAT: "manual",
+    HVACMode.OFF: "off",
 }
 
 
@@ -77,52 +54,64 @@ async def async_setup_platform(
     async_add_entities: AddEntitiesCallback,
     discovery_info: Optional[DiscoveryInfoType] = None,
 ) -> None:
-    """Set up the IntuisNetatmo climate platform."""
-    # Create IntuisNetatmo client
-    client = IntuisNetatmo(
-        username=config[CONF_USERNAME],
-        password=config[CONF_PASSWORD],
-        client_id=config[CONF_CLIENT_ID],
-        client_secret=config[CONF_CLIENT_SECRET],
+    """Import a YAML climate platform configuration into a config entry."""
+    hass.async_create_task(
+        hass.config_entries.flow.async_init(
+            DOMAIN,
+            context={"source": SOURCE_IMPORT},
+            data={
+                CONF_USERNAME: config[CONF_USERNAME],
+                CONF_PASSWORD: config[CONF_PASSWORD],
+                CONF_CLIENT_ID: config[CONF_CLIENT_ID],
+                CONF_CLIENT_SECRET: config[CONF_CLIENT_SECRET],
+            },
+        )
     )
 
-    # Pull initial data
-    client.pull_data()
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the IntuisNetatmo climate platform from a config entry."""
+    coordinator: IntuisNetatmoCoordinator = hass.data[DOMAIN][entry.entry_id]
 
     # Create climate entities for each room
-    entities = []
-    for room in client.rooms.values():
-        entities.append(IntuisNetatmoClimate(client, room))
-
-    async_add_entities(entities)
-
-    # Register service for setting temperature
-    platform = entity_platform.async_get_current_platform()
-    platform.async_register_entity_service(
-        SERVICE_SET_TEMPERATURE,
-        SERVICE_SET_TEMPERATURE_SCHEMA,
-        "async_set_temperature",
+    async_add_entities(
+        IntuisNetatmoClimate(coordinator, room_id) for room_id in coordinator.data
     )
 
 
-class IntuisNetatmoClimate(ClimateEntity):
+class IntuisNetatmoClimate(CoordinatorEntity[IntuisNetatmoCoordinator], ClimateEntity):
     """Representation of an IntuisNetatmo climate device."""
 
-    def __init__(self, client: IntuisNetatmo, room: Any) -> None:
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
+    _attr_precision = PRECISION_TENTHS
+    _attr_supported_features = (
+        ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.PRESET_MODE
+    )
+    _attr_hvac_modes = [HVACMode.AUTO, HVACMode.HEAT, HVACMode.OFF]
+    _attr_preset_modes = ["program", "manual", "off", "hg"]
+    _attr_min_temp = 7.0  # Minimum temperature (frost protection)
+    _attr_max_temp = 30.0  # Maximum temperature
+    _attr_should_poll = False
+
+    def __init__(self, coordinator: IntuisNetatmoCoordinator, room_id: str) -> None:
         """Initialize the climate device."""
-        self._client = client
-        self._room = room
-        self._attr_name = room.name
-        self._attr_unique_id = f"intuis_netatmo_{room.id}"
-        self._attr_temperature_unit = UnitOfTemperature.CELSIUS
-        self._attr_precision = PRECISION_TENTHS
-        self._attr_supported_features = (
-            ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.PRESET_MODE
-        )
-        self._attr_hvac_modes = [HVACMode.AUTO, HVACMode.HEAT, HVACMode.OFF]
-        self._attr_preset_modes = ["program", "manual", "off", "hg"]
-        self._attr_min_temp = 7.0  # Minimum temperature (frost protection)
-        self._attr_max_temp = 30.0  # Maximum temperature
+        super().__init__(coordinator)
+        self._room_id = room_id
+        self._room = coordinator.data[room_id]
+        self._attr_name = self._room.name
+        self._attr_unique_id = "intuis_netatmo_" + str(room_id)
+        self._pending_setpoint: Optional[float] = None
+        self._setpoint_task: Optional[asyncio.Task] = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Pick up this room's latest status from the coordinator."""
+        self._room = self.coordinator.data.get(self._room_id, self._room)
+        super()._handle_coordinator_update()
 
     @property
     def current_temperature(self) -> Optional[float]:
@@ -137,12 +126,20 @@ class IntuisNetatmoClimate(ClimateEntity):
     @property
     def hvac_mode(self) -> HVACMode:
         """Return hvac operation mode."""
-        return MODE_MAP.get(self._room.mode, HVACMode.OFF)
+        mode = self._room.mode
+        if mode == "manual":
+            return HVACMode.HEAT
+        if mode == "program":
+            return HVACMode.AUTO
+        # off, hg (frost protection) and anything unknown
+        return HVACMode.OFF
 
     @property
     def hvac_action(self) -> HVACAction:
         """Return the current running hvac operation."""
-        return ACTION_MAP.get(self._room.mode, HVACAction.IDLE)
+        if self._room.mode == "manual":
+            return HVACAction.HEATING
+        return HVACAction.IDLE
 
     @property
     def preset_mode(self) -> Optional[str]:
@@ -152,59 +149,69 @@ class IntuisNetatmoClimate(ClimateEntity):
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set new target temperature."""
         temperature = kwargs.get(ATTR_TEMPERATURE)
-        if temperature is None:
+        if temperature is None or temperature == self._room.target_temp:
             return
 
-        try:
-            self._client.set_room_setpoint(self._room.id, temperature)
-            self._room.target_temp = temperature
-            self.async_write_ha_state()
-        except Exception as err:
-            _LOGGER.error("Error setting temperature: %s", err)
+        # Only the latest value within the debounce window is sent
+        self._pending_setpoint = temperature
+        self._room.target_temp = temperature
+        self.async_write_ha_state()
+        if self._setpoint_task is None or self._setpoint_task.done():
+            self._setpoint_task = self.hass.async_create_task(
+                self._async_flush_setpoint()
+            )
+
+    async def _async_flush_setpoint(self) -> None:
+        """Send the pending setpoint once no newer value arrives."""
+        while self._pending_setpoint is not None:
+            await asyncio.sleep(SETPOINT_DEBOUNCE)
+            temperature = self._pending_setpoint
+            self._pending_setpoint = None
+            try:
+                await self.coordinator.async_set_room_state(
+                    {"room_id": self._room.id, "mode": "manual", "temp": temperature}
+                )
+            except IntuisNetatmoAPIError as err:
+                _LOGGER.error("Error setting temperature: %s", err)
+                await self.coordinator.async_request_refresh()
+
+    def _mode_update(self, mode: str) -> Dict[str, Any]:
+        """Build the room update that switches this room to the given mode."""
+        update: Dict[str, Any] = {"room_id": self._room.id, "mode": mode}
+        if mode == "manual":
+            # Set to manual mode with current target temperature
+            update["temp"] = self._room.target_temp or 20.0
+        elif mode == "off":
+            update["temp"] = 7  # Frost protection minimum, as set_room_off
+        return update
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
-        mode_map_reverse = {v: k for k, v in MODE_MAP.items()}
-        mode = mode_map_reverse.get(hvac_mode)
+        mode = HVAC_TO_MODE.get(hvac_mode)
         if mode is None:
             return
 
         try:
-            if mode == "manual":
-                # Set to manual mode with current target temperature
-                self._client.set_room_mode(
-                    self._room.id, mode, self._room.target_temp or 20.0
-                )
-            else:
-                self._client.set_room_mode(self._room.id, mode)
+            await self.coordinator.async_set_room_state(self._mode_update(mode))
             self._room.mode = mode
             self.async_write_ha_state()
-        except Exception as err:
+        except IntuisNetatmoAPIError as err:
             _LOGGER.error("Error setting HVAC mode: %s", err)
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
+        if preset_mode == self._room.mode:
+            return
+
         try:
-            if preset_mode == "manual":
-                # Set to manual mode with current target temperature
-                self._client.set_room_mode(
-                    self._room.id, preset_mode, self._room.target_temp or 20.0
-                )
-            else:
-                self._client.set_room_mode(self._room.id, preset_mode)
+            await self.coordinator.async_set_room_state(self._mode_update(preset_mode))
             self._room.mode = preset_mode
             self.async_write_ha_state()
-        except Exception as err:
+        except IntuisNetatmoAPIError as err:
             _LOGGER.error("Error setting preset mode: %s", err)
 
-    async def async_update(self) -> None:
-        """Update the state of the climate entity."""
-        try:
-            self._client.get_homestatus()
-            # Find the updated room status
-            for room in self._client.rooms.values():
-                if room.id == self._room.id:
-                    self._room = room
-                    break
-        except Exception as err:
-            _LOGGER.error("Error updating climate entity: %s", err)
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel any pending setpoint write."""
+        await super().async_will_remove_from_hass()
+        if self._setpoint_task is not None:
+            self._setpoint_task.cancel()
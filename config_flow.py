@@ -1 +1,134 @@
 """Config flow for Muller Intuitiv Climate Integration."""
+
+from __future__ import annotations
+
+from functools import partial
+import logging
+from typing import Any, Dict, Mapping, Optional
+
+from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.const import (
+    CONF_CLIENT_ID,
+    CONF_CLIENT_SECRET,
+    CONF_PASSWORD,
+    CONF_USERNAME,
+)
+import voluptuous as vol
+
+from .const import DOMAIN
+from .IntuisNetatmo import IntuisNetatmo, IntuisNetatmoAPIError, IntuisNetatmoAuthError
+
+_LOGGER = logging.getLogger(__name__)
+
+STEP_USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_USERNAME): str,
+        vol.Required(CONF_PASSWORD): str,
+        vol.Required(CONF_CLIENT_ID): str,
+        vol.Required(CONF_CLIENT_SECRET): str,
+    }
+)
+
+STEP_REAUTH_DATA_SCHEMA = vol.Schema({vol.Required(CONF_PASSWORD): str})
+
+
+class IntuisNetatmoConfigFlow(ConfigFlow, domain=DOMAIN):
+    """Handle a config flow for Muller Intuitiv Climate Integration."""
+
+    VERSION = 1
+
+    async def async_step_user(
+        self, user_input: Optional[Dict[str, Any]] = None
+    ) -> ConfigFlowResult:
+        """Ask for the account credentials and check they can log in."""
+        errors: Dict[str, str] = {}
+        if user_input is not None:
+            await self.async_set_unique_id(user_input[CONF_USERNAME].lower())
+            self._abort_if_unique_id_configured()
+
+            try:
+                await self._async_validate(user_input)
+            except IntuisNetatmoAuthError as err:
+                _LOGGER.debug("IntuisNetatmo rejected the credentials: %s", err)
+                errors["base"] = "invalid_auth"
+            except IntuisNetatmoAPIError as err:
+                _LOGGER.debug("Could not connect to IntuisNetatmo: %s", err)
+                errors["base"] = "cannot_connect"
+            else:
+                return self.async_create_entry(
+                    title=user_input[CONF_USERNAME], data=user_input
+                )
+
+        return self.async_show_form(
+            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+        )
+
+    async def async_step_import(self, import_data: Dict[str, Any]) -> ConfigFlowResult:
+        """Create an entry from a YAML climate platform configuration."""
+        await self.async_set_unique_id(import_data[CONF_USERNAME].lower())
+        self._abort_if_unique_id_configured()
+
+        try:
+            await self._async_validate(import_data)
+        except IntuisNetatmoAuthError as err:
+            _LOGGER.error("Could not import IntuisNetatmo configuration: %s", err)
+            return self.async_abort(reason="invalid_auth")
+        except IntuisNetatmoAPIError as err:
+            _LOGGER.error("Could not import IntuisNetatmo configuration: %s", err)
+            return self.async_abort(reason="cannot_connect")
+        return self.async_create_entry(
+            title=import_data[CONF_USERNAME], data=import_data
+        )
+
+    async def async_step_reauth(
+        self, entry_data: Mapping[str, Any]
+    ) -> ConfigFlowResult:
+        """Start reauthentication after the API rejected the stored credentials."""
+        return await self.async_step_reauth_confirm()
+
+    async def async_step_reauth_confirm(
+        self, user_input: Optional[Dict[str, Any]] = None
+    ) -> ConfigFlowResult:
+        """Ask for a new password and check it can log in."""
+        errors: Dict[str, str] = {}
+        entry = self._get_reauth_entry()
+        if user_input is not None:
+            data = {**entry.data, CONF_PASSWORD: user_input[CONF_PASSWORD]}
+            try:
+                await self._async_validate(data)
+            except IntuisNetatmoAuthError as err:
+                _LOGGER.debug("IntuisNetatmo rejected the credentials: %s", err)
+                errors["base"] = "invalid_auth"
+            except IntuisNetatmoAPIError as err:
+                _LOGGER.debug("Could not connect to IntuisNetatmo: %s", err)
+                errors["base"] = "cannot_connect"
+            else:
+                return self.async_update_reload_and_abort(entry, data=data)
+
+        return self.async_show_form(
+            step_id="reauth_confirm",
+            data_schema=STEP_REAUTH_DATA_SCHEMA,
+            description_placeholders={"username": entry.data[CONF_USERNAME]},
+            errors=errors,
+        )
+
+    async def _async_validate(self, data: Dict[str, Any]) -> None:
+        """Log in and fetch the homes.
+
+        Raises IntuisNetatmoAuthError if the credentials are rejected, or
+        IntuisNetatmoAPIError for any other failure.
+        """
+        # Both the constructor and get_homesdata do blocking I/O
+        client = await self.hass.async_add_executor_job(
+            partial(
+                IntuisNetatmo,
+                username=data[CONF_USERNAME],
+                password=data[CONF_PASSWORD],
+                client_id=data[CONF_CLIENT_ID],
+                client_secret=data[CONF_CLIENT_SECRET],
+            )
+        )
+        try:
+            await self.hass.async_add_executor_job(client.get_homesdata)
+        finally:
+            await self.hass.async_add_executor_job(client.close)
@@ -0,0 +1,105 @@
+"""Data update coordinator for the Muller Intuitiv Climate Integration integration."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import logging
+from typing import Any, Dict, Optional
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import DOMAIN
+from .IntuisNetatmo import (
+    IntuisNetatmo,
+    IntuisNetatmoAPIError,
+    IntuisNetatmoAuthError,
+    IntuisRoom,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds to collect room writes from several entities into one request
+WRITE_BATCH_DELAY = 0.05
+
+
+class IntuisNetatmoCoordinator(DataUpdateCoordinator[Dict[str, IntuisRoom]]):
+    """Fetch the home status once per interval for every room."""
+
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, client: IntuisNetatmo
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=entry,
+            name=DOMAIN,
+            update_interval=timedelta(seconds=60),
+        )
+        self.client = client
+        self._pending_writes: Dict[str, Dict[str, Any]] = {}
+        self._write_future: Optional[asyncio.Future] = None
+        self._flush_task: Optional[asyncio.Task] = None
+
+    async def _async_update_data(self) -> Dict[str, IntuisRoom]:
+        """Refresh the home status and return the rooms keyed by room ID."""
+        try:
+            await self.client.async_get_homestatus(self.hass)
+        except IntuisNetatmoAuthError as err:
+            raise ConfigEntryAuthFailed(f"Invalid credentials: {err}") from err
+        except IntuisNetatmoAPIError as err:
+            raise UpdateFailed(f"Error fetching home status: {err}") from err
+        return self.client.rooms
+
+    async def async_set_room_state(self, update: Dict[str, Any]) -> None:
+        """Queue a room update and send it with any others made in the same window.
+
+        Raises the batched request's error, usually IntuisNetatmoAPIError, if
+        it fails, or CancelledError if the entry is unloaded before it is sent.
+        """
+        self._pending_writes[update["room_id"]] = update
+        if self._write_future is None:
+            self._write_future = self.hass.loop.create_future()
+            self._flush_task = self.hass.async_create_task(
+                self._async_flush_writes(self._write_future)
+            )
+        # Shielded so one cancelled caller doesn't fail the whole batch
+        await asyncio.shield(self._write_future)
+
+    async def _async_flush_writes(self, future: asyncio.Future) -> None:
+        """Send all queued room updates in a single request."""
+        try:
+            await asyncio.sleep(WRITE_BATCH_DELAY)
+            updates = list(self._pending_writes.values())
+            self._pending_writes = {}
+            self._write_future = None
+            await self.hass.async_add_executor_job(self.client.set_rooms_state, updates)
+        # Any failure is handed to the waiting callers rather than lost
+        except Exception as err:
+            future.set_exception(err)
+        else:
+            future.set_result(None)
+        finally:
+            # Cancelled before the batch was taken: drop it so a later write
+            # starts a fresh window instead of waiting on this dead future
+            if self._write_future is future:
+                self._pending_writes = {}
+                self._write_future = None
+            if not future.done():
+                future.cancel()
+
+    @callback
+    def async_cancel_writes(self) -> None:
+        """Cancel any room writes still waiting to be sent."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        # A task cancelled before it starts never reaches its finally block
+        if self._write_future is not None:
+            self._write_future.cancel()
+            self._write_future = None
+        self._pending_writes = {}